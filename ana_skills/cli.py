@@ -12,6 +12,8 @@ app = typer.Typer(
 )
 
 app.command("download")(download_command)
+# "sync" is the name used in the README; kept as an alias of download
+app.command("sync", hidden=True)(download_command)
 app.command("upload")(upload_command)
 
 
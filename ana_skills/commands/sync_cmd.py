@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
+from ana_skills.console import get_console
 from ana_skills.config import (
     config_exists,
+    config_path,
     get_agent,
     get_all_configured_skills,
     get_enabled_skills,
@@ -16,14 +18,13 @@ from ana_skills.config import (
     save_config,
 )
 from ana_skills.models import AgentFramework
-from ana_skills.resources import get_all_skill_names, list_all_skills
+from ana_skills.resources import list_all_skills, skill_family_index
 from ana_skills.sync import sync_skills
 
-console = Console()
-
 
 def _ask_agent() -> AgentFramework:
     """Interactively ask the user which agent environment they use."""
+    console = get_console()
     console.print("\n[bold]Select your agent environment:[/bold]\n")
     console.print("  1) Claude Code")
     console.print("  2) Cursor")
@@ -43,8 +44,34 @@ def _ask_agent() -> AgentFramework:
     return framework
 
 
+def _pick_skills(title: str, skills: Sequence[str], question: str) -> set[str]:
+    """Let the user pick a subset of skills; all are preselected.
+
+    Uses a single questionary checkbox when questionary is installed,
+    otherwise asks a y/n question per skill (``question`` is formatted
+    with ``skill``).
+    """
+    try:
+        import questionary
+    except ImportError:
+        return {
+            skill
+            for skill in skills
+            if typer.prompt(question.format(skill=skill), default="y").strip().lower()
+            == "y"
+        }
+
+    picked = questionary.checkbox(
+        title, choices=[questionary.Choice(skill, checked=True) for skill in skills]
+    ).ask()
+    if picked is None:
+        raise typer.Abort()
+    return set(picked)
+
+
 def _ask_skills_selection() -> dict[str, bool]:
     """Interactively ask which skills to sync, family by family."""
+    console = get_console()
     all_skills = list_all_skills()
     selections: dict[str, bool] = {}
 
@@ -63,9 +90,8 @@ def _ask_skills_selection() -> dict[str, bool]:
             for skill in skills:
                 selections[skill] = False
         elif choice == "s":
-            for skill in skills:
-                yn = typer.prompt(f"    {skill} (y/n)", default="y").strip().lower()
-                selections[skill] = yn == "y"
+            picked = _pick_skills(f"{family} skills", skills, "    {skill} (y/n)")
+            selections.update({skill: skill in picked for skill in skills})
         else:
             console.print("  [yellow]Invalid choice, syncing all.[/yellow]")
             for skill in skills:
@@ -78,9 +104,10 @@ def _ask_skills_selection() -> dict[str, bool]:
 
 def _check_new_skills(cfg: dict) -> dict[str, bool] | None:
     """Check for new skills not yet in the config. Returns updates or None."""
-    configured = set(get_all_configured_skills(cfg).keys())
-    available = get_all_skill_names()
-    new_skills = available - configured
+    console = get_console()
+    configured = get_all_configured_skills(cfg).keys()
+    index = skill_family_index()
+    new_skills = index.keys() - configured
 
     if not new_skills:
         return None
@@ -96,18 +123,19 @@ def _check_new_skills(cfg: dict) -> dict[str, bool] | None:
     if show != "y":
         return None
 
-    updates: dict[str, bool] = {}
-    all_skills = list_all_skills()
-
     # Group new skills by family for nicer display
-    for family, skills in all_skills.items():
-        family_new = [s for s in skills if s in new_skills]
-        if not family_new:
-            continue
+    by_family: dict[str, list[str]] = {}
+    for skill in new_skills:
+        by_family.setdefault(index[skill], []).append(skill)
+
+    updates: dict[str, bool] = {}
+    for family, family_new in sorted(by_family.items()):
+        family_new.sort()
         console.print(f"\n  [cyan]{family}[/cyan]:")
-        for skill in family_new:
-            yn = typer.prompt(f"    Add {skill}? (y/n)", default="y").strip().lower()
-            updates[skill] = yn == "y"
+        picked = _pick_skills(
+            f"New {family} skills to add", family_new, "    Add {skill}? (y/n)"
+        )
+        updates.update({skill: skill in picked for skill in family_new})
 
     return updates
 
@@ -125,6 +153,7 @@ def download_command(
     On first run, asks which agent environment and skills to sync.
     On subsequent runs, syncs previously selected skills and offers to add new ones.
     """
+    console = get_console()
     if not config_exists(project_dir):
         # First time setup
         console.print("[bold]ana_skills setup[/bold]")
@@ -138,7 +167,7 @@ def download_command(
         }
         save_config(project_dir, cfg)
         console.print(
-            f"\nSaved configuration to [cyan]{project_dir / '.ana_skills.yml'}[/cyan]"
+            f"\nSaved configuration to [cyan]{config_path(project_dir)}[/cyan]"
         )
 
         enabled = [name for name, on in selections.items() if on]
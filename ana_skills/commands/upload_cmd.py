@@ -2,24 +2,26 @@
 
 from __future__ import annotations
 
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 
+from ana_skills.console import get_console
 from ana_skills.config import config_exists, get_agent, load_config, save_config
-from ana_skills.models import AGENT_SKILL_PATHS, AgentFramework
+from ana_skills.models import AGENT_SKILL_DIRS, AgentFramework
 from ana_skills.resources import (
     SKILLS_DIR,
     find_skill_family,
     get_all_skill_names,
     get_skill_dir,
+    invalidate_skill_cache,
     list_families,
+    skill_family_index,
 )
-
-console = Console()
+from ana_skills.sync import copy_tree_incremental
 
 
 def _normalize_markdown_ending(content: str) -> str:
@@ -40,20 +42,26 @@ def _normalize_markdown_ending(content: str) -> str:
 
 def _list_project_skills(project_root: Path, framework: AgentFramework) -> list[str]:
     """List all skill names found in the project's agent skills directory."""
-    skill_base = project_root / AGENT_SKILL_PATHS[framework]
-    if not skill_base.exists():
+    skill_base = project_root / AGENT_SKILL_DIRS[framework]
+    try:
+        entries = os.scandir(skill_base)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    if framework == AgentFramework.CURSOR:
-        # Cursor uses flat .md files
-        return sorted(p.stem for p in skill_base.glob("*.md"))
+    with entries:
+        if framework == AgentFramework.CURSOR:
+            # Cursor uses flat .md files
+            return sorted(
+                e.name[:-3] for e in entries if e.name.endswith(".md") and e.is_file()
+            )
 
-    # Claude and Copilot use directories with SKILL.md inside
-    return sorted(
-        d.name
-        for d in skill_base.iterdir()
-        if d.is_dir() and (d / "SKILL.md").exists()
-    )
+        # Claude and Copilot use directories with SKILL.md inside
+        return sorted(
+            e.name
+            for e in entries
+            if e.is_dir(follow_symlinks=False)
+            and os.path.isfile(os.path.join(e.path, "SKILL.md"))
+        )
 
 
 def _upload_skill(
@@ -63,7 +71,8 @@ def _upload_skill(
     family: str,
 ) -> None:
     """Upload a single skill from the project back to the package."""
-    skill_base = project_root / AGENT_SKILL_PATHS[framework]
+    console = get_console()
+    skill_base = project_root / AGENT_SKILL_DIRS[framework]
 
     if framework == AgentFramework.CURSOR:
         src_file = skill_base / f"{skill_name}.md"
@@ -84,23 +93,23 @@ def _upload_skill(
             return
 
         dest_dir = SKILLS_DIR / family / skill_name
-        # Remove old skill dir completely and copy everything fresh
-        if dest_dir.exists():
-            shutil.rmtree(dest_dir)
-        shutil.copytree(src_dir, dest_dir)
+        # Mirror the project copy; unchanged files are left untouched
+        copy_tree_incremental(src_dir, dest_dir)
 
         # Normalize SKILL.md ending
         dest_md = dest_dir / "SKILL.md"
         if dest_md.exists():
             content = dest_md.read_text(encoding="utf-8")
-            content = _normalize_markdown_ending(content)
-            dest_md.write_text(content, encoding="utf-8")
+            normalized = _normalize_markdown_ending(content)
+            if normalized != content:
+                dest_md.write_text(normalized, encoding="utf-8")
 
     console.print(f"  [green]Uploaded[/green] {skill_name} → {family}/{skill_name}")
 
 
 def _ask_family(skill_name: str) -> str:
     """Ask the user which family to place a new skill in."""
+    console = get_console()
     families = list_families()
     console.print(f"\n[bold]Select a family for new skill '{skill_name}':[/bold]\n")
     for i, family in enumerate(families, 1):
@@ -138,6 +147,7 @@ def upload_command(
 
     With a skill name argument, uploads that specific skill (even if new).
     """
+    console = get_console()
     if not config_exists(project_dir):
         console.print(
             "[red]No .ana_skills.yml found. Run 'ana-skills download' first to set up.[/red]"
@@ -160,7 +170,7 @@ def upload_command(
         if skill_name not in project_skills:
             console.print(
                 f"[red]Skill '{skill_name}' not found in project at "
-                f"{project_dir / AGENT_SKILL_PATHS[framework]}[/red]"
+                f"{project_dir / AGENT_SKILL_DIRS[framework]}[/red]"
             )
             raise typer.Exit(1)
 
@@ -174,6 +184,8 @@ def upload_command(
             family = _ask_family(skill_name)
 
         _upload_skill(skill_name, project_dir, framework, family)
+        # The package tree changed; a new skill or family must show up in listings
+        invalidate_skill_cache()
 
         if is_new:
             skills = cfg.get("skills", {})
@@ -194,10 +206,18 @@ def upload_command(
         console.print(
             f"\n[bold]Uploading {len(in_both)} skill(s) back to package...[/bold]"
         )
-        for name in in_both:
-            family = find_skill_family(name)
-            if family:
-                _upload_skill(name, project_dir, framework, family)
+        index = skill_family_index()
+        with ThreadPoolExecutor(max_workers=min(32, len(in_both))) as pool:
+            list(
+                pool.map(
+                    lambda name: _upload_skill(
+                        name, project_dir, framework, index[name]
+                    ),
+                    in_both,
+                )
+            )
+        # Clear the shared listings once, after every worker is done with them
+        invalidate_skill_cache()
         console.print("[bold green]Upload complete.[/bold green]")
     else:
         console.print("[yellow]No matching skills to upload.[/yellow]")
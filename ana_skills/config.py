@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from ana_skills.models import CONFIG_FILE, AgentFramework
+from ana_skills.models import (
+    CONFIG_FILE,
+    CONFIG_FILES,
+    FRAMEWORK_BY_VALUE,
+    AgentFramework,
+)
+
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
 
 def config_path(project_dir: Path) -> Path:
-    """Return the path to the config file."""
+    """Return the path to the config file.
+
+    The first existing name in CONFIG_FILES wins; if none exists the
+    canonical CONFIG_FILE path is returned.
+    """
+    for name in CONFIG_FILES:
+        path = project_dir / name
+        if path.exists():
+            return path
     return project_dir / CONFIG_FILE
 
 
@@ -20,32 +44,102 @@ def config_exists(project_dir: Path) -> bool:
     return config_path(project_dir).exists()
 
 
+def _cache_dir() -> Path:
+    """Return the per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base, "ana_skills")
+
+
+def _cache_path(path: Path) -> Path:
+    """Return the parsed-config cache file for a YAML file.
+
+    Caches live in the user cache directory, keyed by the config's absolute
+    path, so nothing is written into the user's project.
+    """
+    key = hashlib.sha256(os.fsencode(os.path.abspath(path))).hexdigest()
+    return _cache_dir() / f"config-{key}.json"
+
+
+def _read_cache(cache: Path, source: os.stat_result) -> dict[str, Any] | None:
+    """Return the cached config if it was built from the current source file."""
+    try:
+        data = json.loads(cache.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("mtime_ns") != source.st_mtime_ns or data.get("size") != source.st_size:
+        return None
+    return data.get("config")
+
+
+def _write_cache(cache: Path, source: os.stat_result, cfg: dict[str, Any]) -> None:
+    """Atomically write the parsed config cache. Failures are ignored.
+
+    Configs that JSON cannot reproduce exactly (non-string keys, dates, ...)
+    are not cached, so a cache hit always equals the YAML parse.
+    """
+    try:
+        encoded = json.dumps(cfg)
+    except (TypeError, ValueError):
+        return
+    if json.loads(encoded) != cfg:
+        return
+    payload = json.dumps({"mtime_ns": source.st_mtime_ns, "size": source.st_size, "config": cfg})
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, cache)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
 def load_config(project_dir: Path) -> dict[str, Any]:
-    """Load the .ana_skills.yml config. Returns empty dict if missing."""
+    """Load the .ana_skills.yml config. Returns empty dict if missing.
+
+    The parsed result is cached as JSON in the user cache directory and
+    reused while the YAML file's mtime and size are unchanged.
+    """
     path = config_path(project_dir)
-    if not path.exists():
+    try:
+        source = path.stat()
+    except FileNotFoundError:
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+
+    cache = _cache_path(path)
+    cached = _read_cache(cache, source)
+    if cached is not None:
+        return cached
+
+    cfg = yaml.load(path.read_text(encoding="utf-8"), Loader=_Loader) or {}
+    _write_cache(cache, source, cfg)
+    return cfg
+
+
+def _is_sorted(keys: list[str]) -> bool:
+    """Return True if keys are already in ascending order."""
+    return all(a <= b for a, b in zip(keys, keys[1:]))
 
 
 def save_config(project_dir: Path, cfg: dict[str, Any]) -> None:
-    """Save config to .ana_skills.yml."""
+    """Save config to .ana_skills.yml. Skills are written in sorted order."""
     path = config_path(project_dir)
-    if "skills" in cfg:
-        cfg["skills"] = dict(sorted(cfg["skills"].items()))
+    skills = cfg.get("skills")
+    if skills and not _is_sorted(list(skills)):
+        cfg["skills"] = dict(sorted(skills.items()))
     path.write_text(
-        yaml.dump(cfg, default_flow_style=False, sort_keys=False), encoding="utf-8"
+        yaml.dump(cfg, Dumper=_Dumper, default_flow_style=False, sort_keys=False),
+        encoding="utf-8",
     )
+    _cache_path(path).unlink(missing_ok=True)
 
 
 def get_agent(cfg: dict[str, Any]) -> AgentFramework | None:
     """Get the configured agent framework."""
     agent = cfg.get("agent")
-    if agent:
-        try:
-            return AgentFramework(agent)
-        except ValueError:
-            return None
+    if isinstance(agent, str):
+        return FRAMEWORK_BY_VALUE.get(agent)
     return None
 
 
@@ -0,0 +1,17 @@
+"""Shared Rich console, created on first use."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def get_console() -> Console:
+    """Return the process-wide console, importing Rich only when needed."""
+    from rich.console import Console
+
+    return Console()
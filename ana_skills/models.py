@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from enum import Enum
+from pathlib import Path
 
 
 CONFIG_FILE = ".ana_skills.yml"
 
+# Config file names in lookup order; the legacy hyphenated name is still read.
+CONFIG_FILES: tuple[str, ...] = (CONFIG_FILE, ".ana-skills.yml")
+
 
 class AgentFramework(str, Enum):
     """Supported agent environments."""
@@ -21,3 +25,10 @@ AGENT_SKILL_PATHS: dict[AgentFramework, str] = {
     AgentFramework.CURSOR: ".cursor/rules",
     AgentFramework.COPILOT: ".github/skills",
 }
+
+# Precomputed lookups: value -> member, and skill paths as Path objects
+FRAMEWORK_BY_VALUE: dict[str, AgentFramework] = {f.value: f for f in AgentFramework}
+
+AGENT_SKILL_DIRS: dict[AgentFramework, Path] = {
+    framework: Path(path) for framework, path in AGENT_SKILL_PATHS.items()
+}
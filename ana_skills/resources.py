@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 
 # In installed mode, skills are at ana_skills/skills/ (via hatchling force-include).
@@ -10,58 +14,96 @@ from pathlib import Path
 _pkg_skills = Path(__file__).parent / "skills"
 _repo_skills = Path(__file__).parent.parent / "skills"
 SKILLS_DIR = _pkg_skills if _pkg_skills.exists() else _repo_skills
-
-
-def list_families() -> list[str]:
-    """Return sorted list of skill family names (top-level dirs under skills/)."""
-    if not SKILLS_DIR.exists():
-        return []
-    return sorted(
-        d.name
-        for d in SKILLS_DIR.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    )
-
-
-def list_skills_in_family(family: str) -> list[str]:
-    """Return sorted list of skill names within a family."""
-    family_dir = SKILLS_DIR / family
-    if not family_dir.exists():
-        return []
-    return sorted(
-        d.name for d in family_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()
-    )
-
-
-def list_all_skills() -> dict[str, list[str]]:
-    """Return all skills organized by family: {family: [skill_name, ...]}."""
-    result: dict[str, list[str]] = {}
+# String form for internal directory walks; Path is only built at the API boundary
+SKILLS_DIR_STR = os.fspath(SKILLS_DIR)
+
+
+# The listing functions below are cached for the lifetime of the process.
+# Call invalidate_skill_cache() after adding skills to SKILLS_DIR.
+
+
+@lru_cache(maxsize=None)
+def list_families() -> tuple[str, ...]:
+    """Return sorted skill family names (top-level dirs under skills/)."""
+    if not os.path.isdir(SKILLS_DIR_STR):
+        return ()
+    with os.scandir(SKILLS_DIR_STR) as entries:
+        return tuple(
+            sorted(
+                e.name for e in entries if e.is_dir() and not e.name.startswith(".")
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def list_skills_in_family(family: str) -> tuple[str, ...]:
+    """Return sorted skill names within a family."""
+    family_dir = os.path.join(SKILLS_DIR_STR, family)
+    if not os.path.isdir(family_dir):
+        return ()
+    with os.scandir(family_dir) as entries:
+        return tuple(
+            sorted(
+                e.name
+                for e in entries
+                if e.is_dir() and os.path.isfile(os.path.join(e.path, "SKILL.md"))
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def list_all_skills() -> Mapping[str, tuple[str, ...]]:
+    """Return all skills organized by family: {family: (skill_name, ...)}.
+
+    The cached mapping is shared between callers, so it is returned read-only.
+    """
+    result: dict[str, tuple[str, ...]] = {}
     for family in list_families():
         skills = list_skills_in_family(family)
         if skills:
             result[family] = skills
-    return result
+    return MappingProxyType(result)
 
 
 def get_skill_dir(family: str, skill_name: str) -> Path:
     """Return the path to a skill's directory."""
-    return SKILLS_DIR / family / skill_name
+    return Path(SKILLS_DIR_STR, family, skill_name)
 
 
-def get_all_skill_names() -> set[str]:
+@lru_cache(maxsize=None)
+def get_all_skill_names() -> frozenset[str]:
     """Return a flat set of all skill names across all families."""
     names: set[str] = set()
     for family in list_families():
         names.update(list_skills_in_family(family))
-    return names
+    return frozenset(names)
+
+
+@lru_cache(maxsize=None)
+def skill_family_index() -> Mapping[str, str]:
+    """Return a {skill_name: family} mapping built from one walk of the tree.
+
+    The cached mapping is shared between callers, so it is returned read-only.
+    """
+    return MappingProxyType({
+        skill: family
+        for family, skills in list_all_skills().items()
+        for skill in skills
+    })
+
+
+def invalidate_skill_cache() -> None:
+    """Forget cached skill listings so the next call rescans SKILLS_DIR."""
+    list_families.cache_clear()
+    list_skills_in_family.cache_clear()
+    list_all_skills.cache_clear()
+    get_all_skill_names.cache_clear()
+    skill_family_index.cache_clear()
 
 
 def find_skill_family(skill_name: str) -> str | None:
     """Find which family a skill belongs to."""
-    for family in list_families():
-        if skill_name in list_skills_in_family(family):
-            return family
-    return None
+    return skill_family_index().get(skill_name)
 
 
 def parse_skill_frontmatter(content: str) -> tuple[dict[str, str], str]:
@@ -72,14 +114,15 @@ def parse_skill_frontmatter(content: str) -> tuple[dict[str, str], str]:
     if not content.startswith("---"):
         return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Locate the closing delimiter and slice, rather than splitting the body
+    end = content.find("\n---", 3)
+    if end < 0:
         return {}, content
 
     metadata: dict[str, str] = {}
-    for line in parts[1].strip().splitlines():
+    for line in content[3:end].strip().splitlines():
         if ":" in line:
             key, _, value = line.partition(":")
             metadata[key.strip()] = value.strip()
 
-    return metadata, parts[2].lstrip("\n")
+    return metadata, content[end + 4 :].lstrip("\n")
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from rich.console import Console
-
-from ana_skills.models import AgentFramework, AGENT_SKILL_PATHS
+from ana_skills.console import get_console
+from ana_skills.models import AGENT_SKILL_DIRS, AgentFramework
 from ana_skills.resources import (
     find_skill_family,
     get_skill_dir,
     parse_skill_frontmatter,
+    skill_family_index,
 )
 
-console = Console()
+_DEFAULT_TEMPLATE = "---\nname: {name}\ndescription: {description}\n---\n\n{body}\n"
+
+_TEMPLATES: dict[AgentFramework, str] = {
+    AgentFramework.CLAUDE: _DEFAULT_TEMPLATE,
+    AgentFramework.COPILOT: _DEFAULT_TEMPLATE,
+    AgentFramework.CURSOR: (
+        "---\nname: {name}\ndescription: {description}\n"
+        "globs: []\nalwaysApply: false\n---\n\n{body}\n"
+    ),
+}
 
 
 def _wrap_frontmatter(
@@ -24,33 +36,127 @@ def _wrap_frontmatter(
     body: str,
 ) -> str:
     """Wrap skill body with framework-specific YAML frontmatter."""
-    if framework == AgentFramework.CURSOR:
-        return (
-            f"---\nname: {name}\ndescription: {description}\n"
-            f"globs: []\nalwaysApply: false\n---\n\n{body}\n"
-        )
-    return f"---\nname: {name}\ndescription: {description}\n---\n\n{body}\n"
+    return _TEMPLATES[framework].format_map(
+        {"name": name, "description": description, "body": body}
+    )
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly those bytes."""
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+
+    # Raw fd write: the content is already encoded, no buffered file object needed
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _remove(entry: os.DirEntry) -> None:
+    """Remove a file, symlink or directory tree."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def copy_tree_incremental(src: Path, dest: Path) -> None:
+    """Mirror src into dest, copying only files whose size or mtime changed.
+
+    Files are copied with shutil.copy2 so mtimes carry over and unchanged
+    files are skipped on the next run. Entries in dest that no longer
+    exist in src are removed.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dest) as entries:
+        existing = {e.name: e for e in entries}
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = existing.pop(entry.name, None)
+            dest_path = dest / entry.name
+
+            if entry.is_dir():
+                if target is not None and not target.is_dir(follow_symlinks=False):
+                    _remove(target)
+                copy_tree_incremental(Path(entry.path), dest_path)
+                continue
+
+            if target is not None:
+                if target.is_file(follow_symlinks=False):
+                    src_stat = entry.stat()
+                    dest_stat = target.stat(follow_symlinks=False)
+                    if (
+                        src_stat.st_size == dest_stat.st_size
+                        and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+                    ):
+                        continue
+                else:
+                    _remove(target)
+            shutil.copy2(entry.path, dest_path)
+
+    for stale in existing.values():
+        _remove(stale)
 
 
 def _copy_subdirs(src_dir: Path, dest_dir: Path) -> None:
     """Copy all subdirectories from src_dir to dest_dir."""
-    for child in src_dir.iterdir():
-        if child.is_dir():
-            dest = dest_dir / child.name
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(child, dest)
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                copy_tree_incremental(Path(entry.path), dest_dir / entry.name)
+
+
+def _sync_dir_layout(
+    skill_base: Path, name: str, content: str, skill_dir: Path
+) -> None:
+    """Write <name>/SKILL.md and mirror the skill's subdirectories next to it."""
+    dest = skill_base / name
+    dest.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(dest / "SKILL.md", content)
+    _copy_subdirs(skill_dir, dest)
+
+
+def _sync_flat_layout(
+    skill_base: Path, name: str, content: str, skill_dir: Path
+) -> None:
+    """Write a single <name>.md file; subdirectories are not synced."""
+    skill_base.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(skill_base / f"{name}.md", content)
+
+
+# Claude and Copilot use directories with SKILL.md inside; Cursor uses flat .md files
+_SYNC_STRATEGY: dict[AgentFramework, Callable[[Path, str, str, Path], None]] = {
+    AgentFramework.CLAUDE: _sync_dir_layout,
+    AgentFramework.COPILOT: _sync_dir_layout,
+    AgentFramework.CURSOR: _sync_flat_layout,
+}
 
 
 def sync_skill(
     skill_name: str,
     project_root: Path,
     framework: AgentFramework,
+    family: str | None = None,
 ) -> None:
-    """Sync a single skill to the target project."""
-    family = find_skill_family(skill_name)
+    """Sync a single skill to the target project.
+
+    The family is looked up from the skill name unless given.
+    """
+    if family is None:
+        family = find_skill_family(skill_name)
     if family is None:
-        console.print(f"  [yellow]Skill '{skill_name}' not found, skipping[/yellow]")
+        get_console().print(
+            f"  [yellow]Skill '{skill_name}' not found, skipping[/yellow]"
+        )
         return
 
     skill_dir = get_skill_dir(family, skill_name)
@@ -63,32 +169,9 @@ def sync_skill(
     name = meta.get("name", skill_name)
     description = meta.get("description", "")
 
-    skill_base = project_root / AGENT_SKILL_PATHS[framework]
-
-    if framework == AgentFramework.CLAUDE:
-        dest = skill_base / name
-        dest.mkdir(parents=True, exist_ok=True)
-        (dest / "SKILL.md").write_text(
-            _wrap_frontmatter(framework, name, description, body),
-            encoding="utf-8",
-        )
-        _copy_subdirs(skill_dir, dest)
-
-    elif framework == AgentFramework.COPILOT:
-        dest = skill_base / name
-        dest.mkdir(parents=True, exist_ok=True)
-        (dest / "SKILL.md").write_text(
-            _wrap_frontmatter(framework, name, description, body),
-            encoding="utf-8",
-        )
-        _copy_subdirs(skill_dir, dest)
-
-    elif framework == AgentFramework.CURSOR:
-        skill_base.mkdir(parents=True, exist_ok=True)
-        (skill_base / f"{name}.md").write_text(
-            _wrap_frontmatter(framework, name, description, body),
-            encoding="utf-8",
-        )
+    skill_base = project_root / AGENT_SKILL_DIRS[framework]
+    content = _wrap_frontmatter(framework, name, description, body)
+    _SYNC_STRATEGY[framework](skill_base, name, content, skill_dir)
 
 
 def sync_skills(
@@ -96,9 +179,30 @@ def sync_skills(
     project_root: Path,
     framework: AgentFramework,
 ) -> int:
-    """Sync multiple skills. Returns count of synced skills."""
-    count = 0
-    for skill_name in skill_names:
-        sync_skill(skill_name, project_root, framework)
-        count += 1
-    return count
+    """Sync multiple skills. Returns count of synced skills.
+
+    Families are resolved from a single index up front. Skills are
+    independent and the work is file I/O, so they are then read, rendered
+    and written concurrently on a thread pool.
+    """
+    if not skill_names:
+        return 0
+
+    index = skill_family_index()
+    resolved: list[tuple[str, str]] = []
+    for name in skill_names:
+        family = index.get(name)
+        if family is None:
+            get_console().print(f"  [yellow]Skill '{name}' not found, skipping[/yellow]")
+        else:
+            resolved.append((name, family))
+
+    if resolved:
+        with ThreadPoolExecutor(max_workers=min(32, len(resolved))) as pool:
+            list(
+                pool.map(
+                    lambda item: sync_skill(item[0], project_root, framework, item[1]),
+                    resolved,
+                )
+            )
+    return len(skill_names)
@@ -14,11 +14,22 @@ This creates:
         accounting-posting-list-viewer.component.html
 """
 
-import os
+import functools
 import sys
 from pathlib import Path
 
 
+# Fixed import block of the TS scaffold; only the part after it depends on the names
+TS_IMPORTS = """\
+import { Component, ChangeDetectionStrategy, input, output, computed } from '@angular/core';
+import { CommonModule } from '@angular/common';
+import { CoreModule } from '@core/core.module';
+import { MaterialModule, SharedModule } from '@shared/index';
+// TODO: Import DTOs from @api/index
+"""
+
+
+@functools.lru_cache(maxsize=256)
 def to_pascal_case(kebab_name: str) -> str:
     """Convert kebab-case to PascalCase."""
     return "".join(word.capitalize() for word in kebab_name.split("-"))
@@ -40,16 +51,12 @@ def create_presentational_component(feature: str, component_name: str):
     ts_file = base_path / f"{folder_name}.component.ts"
     html_file = base_path / f"{folder_name}.component.html"
 
-    # Create directory
-    base_path.mkdir(parents=True, exist_ok=True)
+    # Create directory (a single stat when it already exists)
+    if not base_path.is_dir():
+        base_path.mkdir(parents=True, exist_ok=True)
 
     # TypeScript content
-    ts_content = f'''import {{ Component, ChangeDetectionStrategy, input, output, computed }} from '@angular/core';
-import {{ CommonModule }} from '@angular/common';
-import {{ CoreModule }} from '@core/core.module';
-import {{ MaterialModule, SharedModule }} from '@shared/index';
-// TODO: Import DTOs from @api/index
-
+    ts_content = TS_IMPORTS + f'''
 @Component({{
   selector: '{selector}',
   imports: [CommonModule, CoreModule, MaterialModule, SharedModule],
@@ -105,8 +112,8 @@ export class {full_component_name} {{
 '''
 
     # Write files
-    ts_file.write_text(ts_content)
-    html_file.write_text(html_content)
+    ts_file.write_bytes(ts_content.encode("utf-8"))
+    html_file.write_bytes(html_content.encode("utf-8"))
 
     print(f"Created presentational component:")
     print(f"  {ts_file}")
@@ -126,8 +133,10 @@ export class {full_component_name} {{
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python .claude/skills/frontend-component/scripts/init_frontend_component.py <feature> <component-name>")
-        print("Example: python .claude/skills/frontend-component/scripts/init_frontend_component.py accounting posting-list-viewer")
+        sys.stderr.write(
+            "Usage: python .claude/skills/frontend-component/scripts/init_frontend_component.py <feature> <component-name>\n"
+            "Example: python .claude/skills/frontend-component/scripts/init_frontend_component.py accounting posting-list-viewer\n"
+        )
         sys.exit(1)
 
     feature = sys.argv[1]
@@ -15,14 +15,33 @@ This creates:
         accounting-dialog-edit-bank-account.component.html
 """
 
+import functools
 import re
 import sys
 from pathlib import Path
 
 
 TEMPLATE_FILE = Path(__file__).parent.parent / "resources" / "dialog-template.md"
+TOKEN_RE = re.compile(r"__(?:FEATURE|feature|NAME|name|FORM)__")
+SCAFFOLD_RE = {
+    marker: re.compile(rf"<!-- scaffold:{marker} -->\s*```\w+\n(.*?)```", re.DOTALL)
+    for marker in ("ts", "html")
+}
+
+
+TODO_CHECKLIST = """\
+TODO:
+  1. Define InputData and OutputData interfaces
+  2. Define FormModel interface and form fields
+  3. Add validators to form()
+  4. Inject your feature service and SharedNotificationService
+  5. Implement save logic in onSubmit (Pattern B)
+  6. Add form fields to HTML template
+  7. Export from feature's components/index.ts
+"""
 
 
+@functools.lru_cache(maxsize=256)
 def to_pascal_case(kebab_name: str) -> str:
     """Convert kebab-case to PascalCase."""
     return "".join(word.capitalize() for word in kebab_name.split("-"))
@@ -30,41 +49,47 @@ def to_pascal_case(kebab_name: str) -> str:
 
 def to_camel_case(kebab_name: str) -> str:
     """Convert kebab-case to camelCase."""
-    parts = kebab_name.split("-")
-    return parts[0] + "".join(word.capitalize() for word in parts[1:])
+    head, _, rest = kebab_name.partition("-")
+    return head + to_pascal_case(rest)
 
 
 def extract_scaffold(template_content: str, marker: str) -> str:
     """Extract code block content following a scaffold marker comment."""
     # Find the marker comment (e.g., <!-- scaffold:ts -->)
-    pattern = rf"<!-- scaffold:{marker} -->\s*```\w+\n(.*?)```"
-    match = re.search(pattern, template_content, re.DOTALL)
+    match = SCAFFOLD_RE[marker].search(template_content)
     if not match:
         raise ValueError(f"Could not find scaffold marker '<!-- scaffold:{marker} -->' in template")
     return match.group(1)
 
 
+@functools.lru_cache(maxsize=1)
+def load_scaffolds() -> tuple[str, str]:
+    """Read the template file once and return its (ts, html) scaffolds."""
+    template_content = TEMPLATE_FILE.read_text(encoding="utf-8")
+    return extract_scaffold(template_content, "ts"), extract_scaffold(template_content, "html")
+
+
 def replace_tokens(content: str, feature_pascal: str, feature_kebab: str,
                    name_pascal: str, name_kebab: str, form_name: str) -> str:
-    """Replace scaffold tokens with actual values."""
-    content = content.replace("__FEATURE__", feature_pascal)
-    content = content.replace("__feature__", feature_kebab)
-    content = content.replace("__NAME__", name_pascal)
-    content = content.replace("__name__", name_kebab)
-    content = content.replace("__FORM__", form_name)
-    return content
+    """Replace scaffold tokens with actual values in a single pass."""
+    mapping = {
+        "__FEATURE__": feature_pascal,
+        "__feature__": feature_kebab,
+        "__NAME__": name_pascal,
+        "__name__": name_kebab,
+        "__FORM__": form_name,
+    }
+    return TOKEN_RE.sub(lambda m: mapping[m.group(0)], content)
 
 
 def create_dialog_component(feature: str, dialog_name: str):
     """Create a dialog component from the scaffold template."""
 
-    # Read template
+    # Check template
     if not TEMPLATE_FILE.exists():
         print(f"Error: Template file not found: {TEMPLATE_FILE}")
         sys.exit(1)
 
-    template_content = TEMPLATE_FILE.read_text()
-
     # Compute names
     feature_pascal = to_pascal_case(feature)
     name_pascal = to_pascal_case(dialog_name)
@@ -74,8 +99,7 @@ def create_dialog_component(feature: str, dialog_name: str):
     selector = f"{feature}-dialog-{dialog_name}"
 
     # Extract scaffold templates
-    ts_content = extract_scaffold(template_content, "ts")
-    html_content = extract_scaffold(template_content, "html")
+    ts_content, html_content = load_scaffolds()
 
     # Replace tokens
     ts_content = replace_tokens(ts_content, feature_pascal, feature, name_pascal, dialog_name, form_name)
@@ -86,37 +110,35 @@ def create_dialog_component(feature: str, dialog_name: str):
     ts_file = base_path / f"{folder_name}.component.ts"
     html_file = base_path / f"{folder_name}.component.html"
 
-    # Create directory
-    base_path.mkdir(parents=True, exist_ok=True)
+    # Create directory (a single stat when it already exists)
+    if not base_path.is_dir():
+        base_path.mkdir(parents=True, exist_ok=True)
 
     # Write files
-    ts_file.write_text(ts_content)
-    html_file.write_text(html_content)
-
-    print(f"Created dialog component:")
-    print(f"  {ts_file}")
-    print(f"  {html_file}")
-    print()
-    print(f"Component: {component_name}")
-    print(f"Selector: {selector}")
-    print()
-    print("TODO:")
-    print("  1. Define InputData and OutputData interfaces")
-    print("  2. Define FormModel interface and form fields")
-    print("  3. Add validators to form()")
-    print("  4. Inject your feature service and SharedNotificationService")
-    print("  5. Implement save logic in onSubmit (Pattern B)")
-    print("  6. Add form fields to HTML template")
-    print("  7. Export from feature's components/index.ts")
-    print()
-    print(f"Template loaded from: {TEMPLATE_FILE}")
-    print("See dialog-template.md Pattern B for the complete reference pattern.")
+    ts_file.write_bytes(ts_content.encode("utf-8"))
+    html_file.write_bytes(html_content.encode("utf-8"))
+
+    sys.stdout.write(
+        "Created dialog component:\n"
+        f"  {ts_file}\n"
+        f"  {html_file}\n"
+        "\n"
+        f"Component: {component_name}\n"
+        f"Selector: {selector}\n"
+        "\n"
+        f"{TODO_CHECKLIST}"
+        "\n"
+        f"Template loaded from: {TEMPLATE_FILE}\n"
+        "See dialog-template.md Pattern B for the complete reference pattern.\n"
+    )
 
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python .claude/skills/frontend-dialog/scripts/init_frontend_dialog.py <feature> <dialog-name>")
-        print("Example: python .claude/skills/frontend-dialog/scripts/init_frontend_dialog.py accounting edit-bank-account")
+        sys.stderr.write(
+            "Usage: python .claude/skills/frontend-dialog/scripts/init_frontend_dialog.py <feature> <dialog-name>\n"
+            "Example: python .claude/skills/frontend-dialog/scripts/init_frontend_dialog.py accounting edit-bank-account\n"
+        )
         sys.exit(1)
 
     feature = sys.argv[1]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Initialize dummy Angular service and store files.
+Initialize Angular service and store files by loading the scaffold templates
+from service-template.md and replacing tokens with actual names.
 
 Usage:
     python .claude/skills/frontend-service/scripts/init_frontend_service.py <feature> <entity-name>
@@ -14,277 +15,116 @@ This creates:
         accounting-document.store.ts
 """
 
-import os
+import functools
+import re
 import sys
 from pathlib import Path
 
 
-def to_pascal_case(kebab_name: str) -> str:
-    """Convert kebab-case to PascalCase."""
-    return "".join(word.capitalize() for word in kebab_name.split("-"))
-
-
-def create_service_files(feature: str, entity_name: str):
-    """Create service and state service files with minimal skeleton."""
-
-    feature_pascal = to_pascal_case(feature)
-    entity_pascal = to_pascal_case(entity_name)
-
-    # Paths
-    base_path = Path("src/ui/src/app/features") / feature / "services"
-    service_file = base_path / f"{feature}-{entity_name}.service.ts"
-    state_file = base_path / f"{feature}-{entity_name}.store.ts"
-
-    # Create directory
-    base_path.mkdir(parents=True, exist_ok=True)
-
-    # State service content
-    state_content = f'''import {{ Injectable, Signal, computed }} from '@angular/core';
-import {{ ListStore, ObjectStore }} from '@core/stores';
-// TODO: Import DTOs from @api/index
-// import {{ {entity_pascal}DTO }} from '@api/index';
-
-// Placeholder type - replace with actual DTO
-type {entity_pascal}DTO = {{ id: string }};
+TEMPLATE_FILE = Path(__file__).parent.parent / "resources" / "service-template.md"
+TOKEN_RE = re.compile(r"__(?:FEATURE|feature|NAME|name|flat)__")
+SCAFFOLD_RE = {
+    marker: re.compile(rf"<!-- scaffold:{marker} -->\s*```\w+\n(.*?)```", re.DOTALL)
+    for marker in ("store", "service")
+}
 
-@Injectable({{ providedIn: 'root' }})
-export class {feature_pascal}{entity_pascal}Store {{
-  /**
-   * Normalized entity store: id -> {entity_pascal}DTO
-   * Single source of truth for all items
-   */
-  readonly {entity_name.replace('-', '')}Entities = new ObjectStore<{entity_pascal}DTO>();
 
-  /**
-   * Search result store: serialized criteria -> {{ id: string }}[]
-   * Stores only item IDs for each search criteria
-   */
-  readonly searchResults = new ListStore<{{ id: string }}>();
-
-  /**
-   * Get items for a search criteria key.
-   * Returns computed signal that joins IDs to entities.
-   */
-  get{entity_pascal}sBySearchKey(searchKey: string): Signal<{entity_pascal}DTO[] | null> {{
-    return computed(() => {{
-      const ids = this.searchResults.get(searchKey)();
-      if (ids === null) return null;
-      return ids
-        .map(item => this.{entity_name.replace('-', '')}Entities.get(item.id)())
-        .filter((doc): doc is {entity_pascal}DTO => !!doc);
-    }});
-  }}
-
-  /**
-   * Check if a search key exists in results
-   */
-  has(searchKey: string): boolean {{
-    return this.searchResults.isInitialized(searchKey);
-  }}
-
-  /**
-   * Store items and their search result IDs
-   */
-  setSearchResults(searchKey: string, items: {entity_pascal}DTO[]): void {{
-    const idList = items.map(item => {{
-      this.{entity_name.replace('-', '')}Entities.set(item.id, item);
-      return {{ id: item.id }};
-    }});
-    this.searchResults.set(searchKey, idList);
-  }}
-
-  /**
-   * Remove an item from entity store and all search results
-   */
-  remove{entity_pascal}(id: string): void {{
-    this.{entity_name.replace('-', '')}Entities.remove(id);
+TODO_CHECKLIST = """\
+TODO:
+  1. Import DTOs from @api/index
+  2. Import and inject API service
+  3. Define SearchCriteria interface
+  4. Implement API calls in all methods
+  5. Export from feature's services/index.ts
+"""
 
-    this.searchResults.getAllKeys().forEach(searchKey => {{
-      const idList = this.searchResults.get(searchKey)();
-      if (idList) {{
-        const filtered = idList.filter(i => i.id !== id);
-        if (filtered.length !== idList.length) {{
-          this.searchResults.set(searchKey, filtered);
-        }}
-      }}
-    }});
-  }}
 
-  clearAll(): void {{
-    this.{entity_name.replace('-', '')}Entities.clear();
-    this.searchResults.clear();
-  }}
+@functools.lru_cache(maxsize=256)
+def to_pascal_case(kebab_name: str) -> str:
+    """Convert kebab-case to PascalCase."""
+    return "".join(word.capitalize() for word in kebab_name.split("-"))
 
-  clearSearchResults(): void {{
-    this.searchResults.clear();
-  }}
-}}
-'''
 
-    # Service content
-    service_content = f'''import {{ Injectable, inject, Signal, untracked }} from '@angular/core';
-import {{ firstValueFrom }} from 'rxjs';
-// TODO: Import API service and DTOs from @api/index
-// import {{
-//   {entity_pascal}DTO,
-//   {entity_pascal}CreateDTO,
-//   {entity_pascal}UpdateDTO,
-//   Private{entity_pascal}ApiService,
-// }} from '@api/index';
-import {{ {feature_pascal}{entity_pascal}Store }} from './{feature}-{entity_name}.store';
-import {{ SharedNotificationService }} from '@shared/index';
+def extract_scaffold(template_content: str, marker: str) -> str:
+    """Extract code block content following a scaffold marker comment."""
+    # Find the marker comment (e.g., <!-- scaffold:store -->)
+    match = SCAFFOLD_RE[marker].search(template_content)
+    if not match:
+        raise ValueError(f"Could not find scaffold marker '<!-- scaffold:{marker} -->' in template")
+    return match.group(1)
 
-export interface {entity_pascal}SearchCriteria {{
-  // TODO: Define search criteria
-  fiscalYearId: string | null;
-}}
 
-// Placeholder types - replace with actual DTOs
-type {entity_pascal}DTO = {{ id: string }};
-type {entity_pascal}CreateDTO = {{}};
-type {entity_pascal}UpdateDTO = {{}};
+@functools.lru_cache(maxsize=1)
+def load_scaffolds() -> tuple[str, str]:
+    """Read the template file once and return its (store, service) scaffolds."""
+    template_content = TEMPLATE_FILE.read_text(encoding="utf-8")
+    return extract_scaffold(template_content, "store"), extract_scaffold(template_content, "service")
 
-@Injectable({{ providedIn: 'root' }})
-export class {feature_pascal}{entity_pascal}Service {{
-  // TODO: Inject API service
-  // private readonly api = inject(Private{entity_pascal}ApiService);
-  private readonly state = inject({feature_pascal}{entity_pascal}Store);
-  private readonly notification = inject(SharedNotificationService);
 
-  /**
-   * Get a single item by ID.
-   */
-  getById(id: string): Signal<{entity_pascal}DTO | null> {{
-    const item = this.state.{entity_name.replace('-', '')}Entities.get(id);
-    if (!item()) {{
-      untracked(() => this.loadById(id));
-    }}
-    return item;
-  }}
+def replace_tokens(content: str, feature_pascal: str, feature_kebab: str,
+                   name_pascal: str, name_kebab: str, name_flat: str) -> str:
+    """Replace scaffold tokens with actual values in a single pass."""
+    mapping = {
+        "__FEATURE__": feature_pascal,
+        "__feature__": feature_kebab,
+        "__NAME__": name_pascal,
+        "__name__": name_kebab,
+        "__flat__": name_flat,
+    }
+    return TOKEN_RE.sub(lambda m: mapping[m.group(0)], content)
 
-  async loadById(id: string, refresh = false): Promise<{entity_pascal}DTO | null> {{
-    const current = this.state.{entity_name.replace('-', '')}Entities.get(id)();
-    if (!refresh && current) {{
-      return current;
-    }}
-    // TODO: Implement API call
-    // const response = await firstValueFrom(this.api.get{entity_pascal}(id));
-    // this.state.{entity_name.replace('-', '')}Entities.set(response.id, response);
-    // return response;
-    return null;
-  }}
 
-  /**
-   * Get items matching search criteria.
-   */
-  getSearchResults(criteria: {entity_pascal}SearchCriteria): Signal<{entity_pascal}DTO[] | null> {{
-    const searchKey = this.serializeCriteria(criteria);
-    if (!this.state.has(searchKey)) {{
-      untracked(() => this.loadSearchResults(criteria, searchKey));
-    }}
-    return this.state.get{entity_pascal}sBySearchKey(searchKey);
-  }}
+def create_service_files(feature: str, entity_name: str):
+    """Create service and state service files from the scaffold template."""
 
-  private serializeCriteria(criteria: {entity_pascal}SearchCriteria): string {{
-    return JSON.stringify({{
-      fiscalYearId: criteria.fiscalYearId,
-      // TODO: Add other criteria fields
-    }});
-  }}
+    # Check template
+    if not TEMPLATE_FILE.exists():
+        print(f"Error: Template file not found: {TEMPLATE_FILE}")
+        sys.exit(1)
 
-  async loadSearchResults(
-    criteria: {entity_pascal}SearchCriteria,
-    searchKey: string = '',
-    refresh = false
-  ): Promise<{entity_pascal}DTO[]> {{
-    if (!criteria.fiscalYearId) {{
-      throw new Error('Fiscal year must be provided');
-    }}
-    if (!searchKey) {{
-      searchKey = this.serializeCriteria(criteria);
-    }}
-    if (!refresh && this.state.has(searchKey)) {{
-      return this.state.get{entity_pascal}sBySearchKey(searchKey)()!;
-    }}
-    // TODO: Implement API call
-    // const response = await firstValueFrom(this.api.list{entity_pascal}s(criteria.fiscalYearId));
-    // this.state.setSearchResults(searchKey, response.items);
-    // return response.items;
-    return [];
-  }}
+    feature_pascal = to_pascal_case(feature)
+    entity_pascal = to_pascal_case(entity_name)
+    # Entity store attribute prefix: bank-document -> bankdocument(Entities)
+    entity_flat = entity_name.replace("-", "")
 
-  invalidateSearchCache(): void {{
-    this.state.clearSearchResults();
-  }}
+    # Paths
+    base_path = Path("src/ui/src/app/features") / feature / "services"
+    service_file = base_path / f"{feature}-{entity_name}.service.ts"
+    state_file = base_path / f"{feature}-{entity_name}.store.ts"
 
-  async create(dto: {entity_pascal}CreateDTO): Promise<{entity_pascal}DTO | null> {{
-    try {{
-      // TODO: Implement API call
-      // const result = await firstValueFrom(this.api.create{entity_pascal}(dto));
-      // this.state.{entity_name.replace('-', '')}Entities.set(result.id, result);
-      // this.state.clearSearchResults();
-      this.notification.success('Luotu onnistuneesti');
-      return null; // TODO: Return result
-    }} catch (error: any) {{
-      const message = error?.error?.detail?.message || 'Luonti epäonnistui';
-      this.notification.error(message);
-      return null;
-    }}
-  }}
+    # Create directory (a single stat when it already exists)
+    if not base_path.is_dir():
+        base_path.mkdir(parents=True, exist_ok=True)
 
-  async update(id: string, dto: {entity_pascal}UpdateDTO): Promise<{entity_pascal}DTO | null> {{
-    try {{
-      // TODO: Implement API call
-      // const result = await firstValueFrom(this.api.update{entity_pascal}(id, dto));
-      // this.state.{entity_name.replace('-', '')}Entities.set(result.id, result);
-      this.notification.success('Päivitetty onnistuneesti');
-      return null; // TODO: Return result
-    }} catch (error: any) {{
-      const message = error?.error?.detail?.message || 'Päivitys epäonnistui';
-      this.notification.error(message);
-      return null;
-    }}
-  }}
+    # Extract scaffold templates
+    state_content, service_content = load_scaffolds()
 
-  async delete(id: string): Promise<boolean> {{
-    try {{
-      // TODO: Implement API call
-      // await firstValueFrom(this.api.delete{entity_pascal}(id));
-      this.state.remove{entity_pascal}(id);
-      this.notification.success('Poistettu onnistuneesti');
-      return true;
-    }} catch (error: any) {{
-      const message = error?.error?.detail?.message || 'Poisto epäonnistui';
-      this.notification.error(message);
-      return false;
-    }}
-  }}
-}}
-'''
+    # Replace tokens
+    state_content = replace_tokens(state_content, feature_pascal, feature, entity_pascal, entity_name, entity_flat)
+    service_content = replace_tokens(service_content, feature_pascal, feature, entity_pascal, entity_name, entity_flat)
 
     # Write files
-    state_file.write_text(state_content)
-    service_file.write_text(service_content)
+    state_file.write_bytes(state_content.encode("utf-8"))
+    service_file.write_bytes(service_content.encode("utf-8"))
 
-    print(f"Created service files:")
-    print(f"  {state_file}")
-    print(f"  {service_file}")
-    print()
-    print(f"Store: {feature_pascal}{entity_pascal}Store")
-    print(f"Service: {feature_pascal}{entity_pascal}Service")
-    print()
-    print("TODO:")
-    print("  1. Import DTOs from @api/index")
-    print("  2. Import and inject API service")
-    print("  3. Define SearchCriteria interface")
-    print("  4. Implement API calls in all methods")
-    print("  5. Export from feature's services/index.ts")
+    sys.stdout.write(
+        "Created service files:\n"
+        f"  {state_file}\n"
+        f"  {service_file}\n"
+        "\n"
+        f"Store: {feature_pascal}{entity_pascal}Store\n"
+        f"Service: {feature_pascal}{entity_pascal}Service\n"
+        "\n"
+        f"{TODO_CHECKLIST}"
+    )
 
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python .claude/skills/frontend-service/scripts/init_frontend_service.py <feature> <entity-name>")
-        print("Example: python .claude/skills/frontend-service/scripts/init_frontend_service.py accounting document")
+        sys.stderr.write(
+            "Usage: python .claude/skills/frontend-service/scripts/init_frontend_service.py <feature> <entity-name>\n"
+            "Example: python .claude/skills/frontend-service/scripts/init_frontend_service.py accounting document\n"
+        )
         sys.exit(1)
 
     feature = sys.argv[1]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Initialize a dummy Angular store file.
+Initialize an Angular store file by loading the scaffold template
+from store-templates.md and replacing tokens with actual names.
 
 Usage:
     python .claude/skills/frontend-store/scripts/init_frontend_store.py <feature> <entity-name>
@@ -13,18 +14,63 @@ This creates:
         accounting-document.store.ts
 """
 
-import os
+import functools
+import re
 import sys
 from pathlib import Path
 
 
+TEMPLATE_FILE = Path(__file__).parent.parent / "resources" / "store-templates.md"
+TOKEN_RE = re.compile(r"__(?:FEATURE|feature|NAME|name)__")
+SCAFFOLD_RE = re.compile(r"<!-- scaffold:store -->\s*```\w+\n(.*?)```", re.DOTALL)
+
+
+TODO_CHECKLIST = """\
+TODO:
+  1. Import DTOs from @api/index
+  2. Replace placeholder types with actual DTOs
+  3. Adjust store types based on your data needs:
+     - Pattern 1: ListStore (Summary) + ObjectStore (Full) - current template
+     - Pattern 2: ID List + Entity Store (Normalized)
+     - Pattern 3: Simple ListStore
+  4. Export from feature's services/index.ts
+"""
+
+
+@functools.lru_cache(maxsize=256)
 def to_pascal_case(kebab_name: str) -> str:
     """Convert kebab-case to PascalCase."""
     return "".join(word.capitalize() for word in kebab_name.split("-"))
 
 
+@functools.lru_cache(maxsize=1)
+def load_scaffold() -> str:
+    """Read the template file once and return its store scaffold."""
+    match = SCAFFOLD_RE.search(TEMPLATE_FILE.read_text(encoding="utf-8"))
+    if not match:
+        raise ValueError("Could not find scaffold marker '<!-- scaffold:store -->' in template")
+    return match.group(1)
+
+
+def replace_tokens(content: str, feature_pascal: str, feature_kebab: str,
+                   name_pascal: str, name_kebab: str) -> str:
+    """Replace scaffold tokens with actual values in a single pass."""
+    mapping = {
+        "__FEATURE__": feature_pascal,
+        "__feature__": feature_kebab,
+        "__NAME__": name_pascal,
+        "__name__": name_kebab,
+    }
+    return TOKEN_RE.sub(lambda m: mapping[m.group(0)], content)
+
+
 def create_store_file(feature: str, entity_name: str):
-    """Create state service file with minimal skeleton."""
+    """Create state service file from the scaffold template."""
+
+    # Check template
+    if not TEMPLATE_FILE.exists():
+        print(f"Error: Template file not found: {TEMPLATE_FILE}")
+        sys.exit(1)
 
     feature_pascal = to_pascal_case(feature)
     entity_pascal = to_pascal_case(entity_name)
@@ -33,125 +79,32 @@ def create_store_file(feature: str, entity_name: str):
     base_path = Path("src/ui/src/app/features") / feature / "services"
     state_file = base_path / f"{feature}-{entity_name}.store.ts"
 
-    # Create directory
-    base_path.mkdir(parents=True, exist_ok=True)
-
-    # State service content
-    state_content = f'''import {{ Injectable, Signal, computed }} from '@angular/core';
-import {{ ListStore, ObjectStore }} from '@core/stores';
-// TODO: Import DTOs from @api/index
-// import {{ {entity_pascal}DTO, {entity_pascal}SummaryDTO }} from '@api/index';
-
-// Placeholder types - replace with actual DTOs
-type {entity_pascal}DTO = {{ id: string }};
-type {entity_pascal}SummaryDTO = {{ id: string; name: string }};
-
-@Injectable({{ providedIn: 'root' }})
-export class {feature_pascal}{entity_pascal}Store {{
-  /**
-   * LIST STORE: Contains summary objects for list views.
-   * - Keyed by search criteria (e.g., fiscalYearId, or 'all')
-   * - Contains {entity_pascal}SummaryDTO which is a subset of {entity_pascal}DTO
-   * - Used by list components to display tables/cards
-   */
-  readonly listItemsStore = new ListStore<{entity_pascal}SummaryDTO>();
-
-  /**
-   * OBJECT STORE: Contains full objects for detail views.
-   * - Keyed by item ID
-   * - Contains {entity_pascal}DTO with all fields and relationships
-   * - Used by detail/edit components
-   */
-  readonly itemStore = new ObjectStore<{entity_pascal}DTO>();
-
-  /**
-   * Get list items for a search key.
-   * Returns summary DTOs suitable for list views.
-   */
-  getListItems(searchKey: string): Signal<{entity_pascal}SummaryDTO[] | null> {{
-    return this.listItemsStore.get(searchKey);
-  }}
-
-  /**
-   * Get full item by ID.
-   * Returns complete DTO for detail views.
-   */
-  getItem(id: string): Signal<{entity_pascal}DTO | null> {{
-    return this.itemStore.get(id);
-  }}
-
-  /**
-   * Store list items from search results.
-   */
-  setListItems(searchKey: string, items: {entity_pascal}SummaryDTO[]): void {{
-    this.listItemsStore.set(searchKey, items);
-  }}
-
-  /**
-   * Store a full item.
-   * NOTE: When updating an item, you may need to also update or clear
-   * the listItemsStore depending on your use case.
-   */
-  setItem(id: string, item: {entity_pascal}DTO): void {{
-    this.itemStore.set(id, item);
-    // Option A: Clear list caches to force refresh
-    // this.listItemsStore.clear();
-  }}
-
-  /**
-   * Remove an item from both stores.
-   */
-  removeItem(id: string): void {{
-    this.itemStore.remove(id);
-
-    // Remove from all list caches
-    this.listItemsStore.getAllKeys().forEach(searchKey => {{
-      const items = this.listItemsStore.get(searchKey)();
-      if (items) {{
-        const filtered = items.filter(i => i.id !== id);
-        if (filtered.length !== items.length) {{
-          this.listItemsStore.set(searchKey, filtered);
-        }}
-      }}
-    }});
-  }}
-
-  clearAll(): void {{
-    this.listItemsStore.clear();
-    this.itemStore.clear();
-  }}
-
-  /**
-   * Clear list caches only (items remain for detail views).
-   */
-  clearListCaches(): void {{
-    this.listItemsStore.clear();
-  }}
-}}
-'''
+    # Create directory (a single stat when it already exists)
+    if not base_path.is_dir():
+        base_path.mkdir(parents=True, exist_ok=True)
+
+    # Extract scaffold template and replace tokens
+    state_content = replace_tokens(load_scaffold(), feature_pascal, feature, entity_pascal, entity_name)
 
     # Write file
-    state_file.write_text(state_content)
-
-    print(f"Created store file:")
-    print(f"  {state_file}")
-    print()
-    print(f"Store: {feature_pascal}{entity_pascal}Store")
-    print()
-    print("TODO:")
-    print("  1. Import DTOs from @api/index")
-    print("  2. Replace placeholder types with actual DTOs")
-    print("  3. Adjust store types based on your data needs:")
-    print("     - Pattern 1: ListStore (Summary) + ObjectStore (Full) - current template")
-    print("     - Pattern 2: ID List + Entity Store (Normalized)")
-    print("     - Pattern 3: Simple ListStore")
-    print("  4. Export from feature's services/index.ts")
+    state_file.write_bytes(state_content.encode("utf-8"))
+
+    sys.stdout.write(
+        "Created store file:\n"
+        f"  {state_file}\n"
+        "\n"
+        f"Store: {feature_pascal}{entity_pascal}Store\n"
+        "\n"
+        f"{TODO_CHECKLIST}"
+    )
 
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python .claude/skills/frontend-store/scripts/init_frontend_store.py <feature> <entity-name>")
-        print("Example: python .claude/skills/frontend-store/scripts/init_frontend_store.py accounting document")
+        sys.stderr.write(
+            "Usage: python .claude/skills/frontend-store/scripts/init_frontend_store.py <feature> <entity-name>\n"
+            "Example: python .claude/skills/frontend-store/scripts/init_frontend_store.py accounting document\n"
+        )
         sys.exit(1)
 
     feature = sys.argv[1]
@@ -6,6 +6,9 @@ Supports single-domain and multi-domain configurations, API and worker services.
 """
 
 import argparse
+import functools
+import hashlib
+import io
 import re
 import time
 from getpass import getpass
@@ -15,10 +18,20 @@ import yaml
 from fabric import Connection
 from invoke import UnexpectedExit
 
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+TEMPLATE_RE = re.compile(r"\{\{(\w+)\}\}")
+DOMAIN_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9]")
+CERT_PATH = "/etc/letsencrypt/live/{domain}/fullchain.pem"
+
 
 def make_domain_safe(domain: str) -> str:
     """Convert domain to safe identifier for nginx configs."""
-    return re.sub(r"[^a-zA-Z0-9]", "_", domain)
+    return DOMAIN_UNSAFE_RE.sub("_", domain)
 
 
 def load_config(config_path: Path) -> dict:
@@ -26,7 +39,9 @@ def load_config(config_path: Path) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    data = yaml.safe_load(config_path.read_text())
+    # libyaml reads straight from the file handle
+    with config_path.open("rb") as f:
+        data = yaml.load(f, Loader=YamlLoader)
 
     required = ["REMOTE_USER", "REMOTE_HOST", "REMOTE_BASE", "DIR_USER", "DIR_GROUP"]
     missing = [f for f in required if not data.get(f)]
@@ -34,10 +49,10 @@ def load_config(config_path: Path) -> dict:
         raise ValueError(f"Missing required config: {', '.join(missing)}")
 
     # Resolve {{REMOTE_BASE}} templates in string values
-    remote_base = data["REMOTE_BASE"]
+    template_values = {"REMOTE_BASE": data["REMOTE_BASE"]}
     for key, value in data.items():
-        if isinstance(value, str) and "{{REMOTE_BASE}}" in value:
-            data[key] = value.replace("{{REMOTE_BASE}}", remote_base)
+        if isinstance(value, str) and "{{" in value:
+            data[key] = render_template(value, template_values)
 
     return data
 
@@ -51,7 +66,7 @@ def get_domains(config: dict) -> list[str]:
     raise ValueError("Config must have DOMAIN or DOMAINS")
 
 
-def build_replacements(config: dict, domain: str | None = None) -> dict[str, str]:
+def build_replacements(config: dict) -> dict[str, str]:
     """Build template replacement dictionary from config."""
     remote_base = config["REMOTE_BASE"]
 
@@ -76,19 +91,20 @@ def build_replacements(config: dict, domain: str | None = None) -> dict[str, str
         ),
     }
 
-    if domain:
-        replacements["DOMAIN"] = domain
-        replacements["DOMAIN_SAFE"] = make_domain_safe(domain)
-
     return replacements
 
 
+def with_domain(replacements: dict[str, str], domain: str) -> dict[str, str]:
+    """Extend the shared replacements with the per-domain keys."""
+    return {**replacements, "DOMAIN": domain, "DOMAIN_SAFE": make_domain_safe(domain)}
+
+
 def render_template(template: str, replacements: dict[str, str]) -> str:
-    """Render template with {{KEY}} style replacements."""
-    result = template
-    for key, value in replacements.items():
-        result = result.replace(f"{{{{{key}}}}}", value)
-    return result
+    """Render template with {{KEY}} style replacements.
+
+    Unknown keys are left as-is.
+    """
+    return TEMPLATE_RE.sub(lambda m: replacements.get(m.group(1), m.group(0)), template)
 
 
 def get_connection(config: dict) -> Connection:
@@ -100,105 +116,129 @@ def get_connection(config: dict) -> Connection:
     password = getpass("Enter sudo password: ")
     c = Connection(f"{remote_user}@{remote_host}", connect_kwargs={"password": password})
     c.config.sudo.password = password
+    # Every run/sudo/put opens a channel on this one transport; keep it
+    # alive so idle stretches (e.g. long certbot runs) do not drop it
+    c.open()
+    c.transport.set_keepalive(30)
     return c
 
 
-def upload_service_file(
-    c: Connection,
-    config: dict,
-    service_name: str,
-    replacements: dict[str, str],
-) -> None:
-    """Render and upload a systemd service file."""
-    template_path = Path(__file__).parent / service_name
+@functools.lru_cache(maxsize=None)
+def read_template(name: str) -> str | None:
+    """Read a template next to this script once, or None if it is missing."""
+    template_path = Path(__file__).parent / name
     if not template_path.exists():
-        print(f"Template {template_path} not found, skipping")
-        return
+        return None
+    return template_path.read_text()
+
+
+def render_service_file(service_name: str, replacements: dict[str, str]) -> str | None:
+    """Render a systemd service file, or None if its template is missing."""
+    template = read_template(service_name)
+    if template is None:
+        print(f"Template {Path(__file__).parent / service_name} not found, skipping")
+        return None
 
     print(f"Rendering {service_name}...")
-    content = render_template(template_path.read_text(), replacements)
+    return render_template(template, replacements)
 
-    tmp_file = Path(__file__).parent / f"{service_name}.tmp"
-    tmp_file.write_text(content)
 
-    remote_user = config["REMOTE_USER"]
-    remote_path = f"/home/{remote_user}/{service_name}"
-    print(f"Uploading {service_name}...")
-    c.put(str(tmp_file), remote_path)
-    tmp_file.unlink()
-
-    c.sudo(f"mv -f {remote_path} /etc/systemd/system/", echo=True)
-    c.sudo(f"chown root:root /etc/systemd/system/{service_name}", echo=True)
-    c.sudo(f"chmod 644 /etc/systemd/system/{service_name}", echo=True)
-
-
-def upload_nginx_config(
-    c: Connection,
-    config: dict,
-    domain: str,
-    replacements: dict[str, str],
-) -> None:
-    """Render and upload nginx config for a domain."""
-    template_path = Path(__file__).parent / "nginx.template"
-    if not template_path.exists():
-        print(f"Nginx template not found at {template_path}")
-        return
+def render_nginx_config(domain: str, replacements: dict[str, str]) -> str | None:
+    """Render nginx config for a domain, or None if the template is missing."""
+    # Read once, rendered for every domain
+    template = read_template("nginx.template")
+    if template is None:
+        print(f"Nginx template not found at {Path(__file__).parent / 'nginx.template'}")
+        return None
 
     print(f"Rendering nginx config for {domain}...")
-    content = render_template(template_path.read_text(), replacements)
+    return render_template(template, replacements)
 
-    tmp_file = Path(__file__).parent / f"{domain}.tmp"
-    tmp_file.write_text(content)
+
+def installed_digests(c: Connection, paths: list[str]) -> dict[str, str]:
+    """Return sha256 digests of the remote files that exist, using one remote call."""
+    # sha256sum prints "<digest>  <path>" for each readable file
+    result = c.run(f"sha256sum {' '.join(paths)}", hide=True, warn=True)
+    return {path: digest for digest, path in (line.split(maxsplit=1) for line in result.stdout.splitlines())}
+
+
+def upload_files(c: Connection, config: dict, target_dir: str, files: dict[str, str]) -> None:
+    """Upload rendered files and install them root-owned into target_dir.
+
+    Files whose installed copy already has the same content are skipped.
+    The rest share one SFTP session and a single sudo install call,
+    instead of a mv/chown/chmod round trip per file.
+    """
+    if not files:
+        return
+
+    encoded = {name: content.encode("utf-8") for name, content in files.items()}
+    installed = installed_digests(c, [f"{target_dir}/{name}" for name in encoded])
+    changed = {
+        name: data for name, data in encoded.items()
+        if installed.get(f"{target_dir}/{name}") != hashlib.sha256(data).hexdigest()
+    }
+    for name in encoded:
+        if name not in changed:
+            print(f"{name} unchanged, skipping upload")
+    if not changed:
+        return
 
     remote_user = config["REMOTE_USER"]
-    remote_path = f"/home/{remote_user}/{domain}"
-    print(f"Uploading nginx config for {domain}...")
-    c.put(str(tmp_file), remote_path)
-    tmp_file.unlink()
+    staged = [f"/home/{remote_user}/{name}" for name in changed]
+    for remote_path, (name, data) in zip(staged, changed.items()):
+        print(f"Uploading {name}...")
+        c.put(io.BytesIO(data), remote_path)
 
-    c.sudo(f"mv -f {remote_path} /etc/nginx/sites-available/", echo=True)
-    c.sudo(f"chown root:root /etc/nginx/sites-available/{domain}", echo=True)
+    c.sudo(f"install -o root -g root -m 644 {' '.join(staged)} {target_dir}/", echo=True)
+    c.run(f"rm -f {' '.join(staged)}", echo=True)
 
 
-def setup_ssl(c: Connection, domain: str, email: str) -> None:
-    """Generate or verify SSL certificates for a domain."""
-    cert_exists = False
-    try:
-        c.run(f"ls /etc/letsencrypt/live/{domain}/fullchain.pem", hide=True)
-        cert_exists = True
-        print(f"SSL certificates already exist for {domain}")
-    except UnexpectedExit:
-        print(f"SSL certificates do not exist for {domain}, generating...")
+def existing_certificates(c: Connection, domains: list[str]) -> set[str]:
+    """Return the domains that already have SSL certificates, using one remote call."""
+    paths = " ".join(CERT_PATH.format(domain=domain) for domain in domains)
+    # ls prints the paths that exist and exits non-zero if any are missing
+    found = set(c.run(f"ls -1 {paths}", hide=True, warn=True).stdout.splitlines())
+    return {domain for domain in domains if CERT_PATH.format(domain=domain) in found}
 
-    if not cert_exists:
-        c.sudo("/bin/systemctl stop nginx", warn=True, echo=True)
-        try:
-            c.sudo(
-                f"certbot certonly --standalone -d {domain} "
-                f"--non-interactive --agree-tos -m {email}",
-                echo=True,
-            )
-            print("SSL certificates generated successfully")
-        except UnexpectedExit as e:
-            print(f"Error: Certbot failed for {domain}: {e}")
-            return
+
+def issue_certificate(c: Connection, domain: str, email: str) -> None:
+    """Generate SSL certificates for a domain with standalone certbot."""
+    print(f"SSL certificates do not exist for {domain}, generating...")
+    try:
+        c.sudo(
+            f"certbot certonly --standalone -d {domain} "
+            f"--non-interactive --agree-tos -m {email}",
+            echo=True,
+        )
+        print("SSL certificates generated successfully")
+    except UnexpectedExit as e:
+        print(f"Error: Certbot failed for {domain}: {e}")
 
 
 def setup_nginx(c: Connection, config: dict) -> None:
     """Set up nginx sites and SSL certificates."""
     domains = get_domains(config)
     email = config.get("EMAIL", "")
+    certified = existing_certificates(c, domains)
 
     for domain in domains:
-        print(f"\n---- Setting up nginx for {domain} ----")
-        setup_ssl(c, domain, email)
+        if domain in certified:
+            print(f"SSL certificates already exist for {domain}")
 
-        # Enable site
-        c.sudo(
-            f"ln -sfn /etc/nginx/sites-available/{domain} /etc/nginx/sites-enabled/{domain}",
-            warn=True,
-            echo=True,
-        )
+    missing = [domain for domain in domains if domain not in certified]
+    if missing:
+        # Standalone certbot binds port 80, so nginx is stopped once for all
+        # new certificates; each -d is issued separately to keep one
+        # certificate (and live/ directory) per domain
+        c.sudo("/bin/systemctl stop nginx", warn=True, echo=True)
+        for domain in missing:
+            print(f"\n---- Setting up SSL for {domain} ----")
+            issue_certificate(c, domain, email)
+
+    # Enable all sites with one link call
+    sites = " ".join(f"/etc/nginx/sites-available/{domain}" for domain in domains)
+    c.sudo(f"ln -sf -t /etc/nginx/sites-enabled {sites}", warn=True, echo=True)
 
     print("\nTesting and starting nginx...")
     try:
@@ -210,6 +250,26 @@ def setup_nginx(c: Connection, config: dict) -> None:
         print("Check nginx configuration and SSL certificate paths")
 
 
+def wait_until_active(c: Connection, service_name: str, timeout: float = 10.0) -> None:
+    """Poll the service state with backoff until it is active or failed."""
+    print(f"Waiting for {service_name} to become active...")
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        # is-active needs no sudo; it prints the unit state (active, activating, failed, ...)
+        state = c.run(f"systemctl is-active {service_name}", hide=True, warn=True).stdout.strip()
+        if state == "active":
+            return
+        if state == "failed":
+            print(f"Warning: {service_name} failed to start")
+            return
+        if time.monotonic() >= deadline:
+            print(f"Warning: {service_name} not active after {timeout:.0f}s")
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
 def setup_services(c: Connection, config: dict) -> None:
     """Enable and start systemd services."""
     services = []
@@ -222,15 +282,20 @@ def setup_services(c: Connection, config: dict) -> None:
         print("No services configured")
         return
 
+    # systemctl takes several units per call, so each step is one sudo
+    # call for all services rather than one per service
+    units = " ".join(services)
+    print(f"\n---- Setting up {', '.join(services)} ----")
     c.sudo("/bin/systemctl daemon-reload", echo=True)
+    c.sudo(f"/bin/systemctl enable {units}", echo=True)
+    c.sudo(f"/bin/systemctl restart {units}", echo=True)
 
     for service_name in services:
-        print(f"\n---- Setting up {service_name} ----")
-        c.sudo(f"/bin/systemctl enable {service_name}", echo=True)
-        c.sudo(f"/bin/systemctl restart {service_name}", echo=True)
-        print("Waiting 5 seconds...")
-        time.sleep(5)
-        c.sudo(f"/bin/systemctl status {service_name}", echo=True)
+        wait_until_active(c, service_name)
+    c.sudo(f"/bin/systemctl status {units}", echo=True)
+
+    # Logs stay per service so each gets its own last 10 lines
+    for service_name in services:
         c.sudo(f"/usr/bin/journalctl -u {service_name} -n 10 --no-pager", echo=True)
 
 
@@ -257,16 +322,23 @@ def main() -> None:
     replacements = build_replacements(config)
 
     # Upload service files
-    if config.get("SERVICE_NAME"):
-        upload_service_file(c, config, config["SERVICE_NAME"], replacements)
-
-    if config.get("WORKER_SERVICE_NAME"):
-        upload_service_file(c, config, config["WORKER_SERVICE_NAME"], replacements)
+    service_files = {}
+    for key in ("SERVICE_NAME", "WORKER_SERVICE_NAME"):
+        service_name = config.get(key)
+        if not service_name:
+            continue
+        content = render_service_file(service_name, replacements)
+        if content is not None:
+            service_files[service_name] = content
+    upload_files(c, config, "/etc/systemd/system", service_files)
 
     # Upload nginx configs (one per domain)
+    nginx_configs = {}
     for domain in domains:
-        domain_replacements = build_replacements(config, domain)
-        upload_nginx_config(c, config, domain, domain_replacements)
+        content = render_nginx_config(domain, with_domain(replacements, domain))
+        if content is not None:
+            nginx_configs[domain] = content
+    upload_files(c, config, "/etc/nginx/sites-available", nginx_configs)
 
     # Set up nginx and SSL
     setup_nginx(c, config)
@@ -1,5 +1,6 @@
 """Shared utilities for MCC build and deploy scripts."""
 
+import shlex
 import subprocess
 import sys
 
@@ -14,9 +15,11 @@ def run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
     ):
         if len(cmd) < 3 or cmd[2] != "--frozen":
             cmd = [cmd[0], cmd[1], "--frozen"] + cmd[2:]
-    print("Running command:", " ".join(cmd), flush=True)
-    sys.stdout.flush()
-    sys.stderr.flush()
+    # print(flush=True) already drains stdout; stderr only needs draining
+    # when the child writes to the same terminal
+    print("Running command:", shlex.join(cmd), flush=True)
+    if not kwargs.get("capture_output"):
+        sys.stderr.flush()
     check = kwargs.pop("check", True)
     result = subprocess.run(cmd, check=check, **kwargs)
     return result
@@ -111,8 +111,9 @@ def test_import_creates_postings_from_auto_apply_template(
     assert len(postings) == 2, f"Expected 2 postings, got {len(postings)}"
 
     # Find debit and credit postings
-    debit_posting = next((p for p in postings if p["side"] == "debit"), None)
-    credit_posting = next((p for p in postings if p["side"] == "credit"), None)
+    postings_by_side = {p["side"]: p for p in postings}
+    debit_posting = postings_by_side.get("debit")
+    credit_posting = postings_by_side.get("credit")
 
     assert debit_posting is not None, "Expected a debit posting"
     assert credit_posting is not None, "Expected a credit posting"